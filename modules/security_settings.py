@@ -1,13 +1,28 @@
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
+from collections import defaultdict
 from utils.security_validator import (
+    build_security_config,
     validate_security_configuration,
     validate_admin_account,
     create_security_visualization,
     generate_security_recommendations
 )
 
+_BEST_PRACTICES = [
+    "Use the principle of least privilege for all accounts",
+    "Implement role-based access control",
+    "Keep all systems updated with security patches",
+    "Use encrypted communications for sensitive traffic",
+    "Implement secure boot and code integrity where possible",
+    "Regularly audit and review access permissions",
+    "Use strong password policies",
+    "Configure Distributed Key Management for encryption key security",
+    "Isolate different network traffic types",
+    "Regularly back up Active Directory to protect DKM keys"
+]
+
 # Helper functions for security settings
 
 def _initialize_security_config():
@@ -367,42 +382,28 @@ def _render_security_recommendations(security_config):
     recommendations = generate_security_recommendations(security_config)
     
     # Group recommendations by category
-    by_category = {}
+    by_category = defaultdict(list)
     for rec in recommendations:
-        category = rec["category"]
-        if category not in by_category:
-            by_category[category] = []
-        by_category[category].append(rec)
+        by_category[rec["category"]].append(rec)
     
     # Display recommendations by category
     for category, recs in by_category.items():
         with st.expander(f"{category} Recommendations", expanded=True):
-            for rec in recs:
-                st.subheader(rec["title"])
-                st.write(rec["description"])
-                st.markdown(f"**Impact:** {rec['impact']}")
-                st.markdown(f"**Implementation:** {rec['implementation']}")
-                st.markdown("---")
+            # Emit each category as a single markdown element
+            st.markdown("\n\n".join(
+                f"### {rec['title']}\n\n"
+                f"{rec['description']}\n\n"
+                f"**Impact:** {rec['impact']}\n\n"
+                f"**Implementation:** {rec['implementation']}\n\n"
+                "---"
+                for rec in recs
+            ))
 
 def _render_security_best_practices():
     """Render security best practices."""
     st.header("Security Best Practices")
     
-    best_practices = [
-        "Use the principle of least privilege for all accounts",
-        "Implement role-based access control",
-        "Keep all systems updated with security patches",
-        "Use encrypted communications for sensitive traffic",
-        "Implement secure boot and code integrity where possible",
-        "Regularly audit and review access permissions",
-        "Use strong password policies",
-        "Configure Distributed Key Management for encryption key security",
-        "Isolate different network traffic types",
-        "Regularly back up Active Directory to protect DKM keys"
-    ]
-    
-    for practice in best_practices:
-        st.markdown(f"- {practice}")
+    st.markdown("\n".join(f"- {practice}" for practice in _BEST_PRACTICES))
 
 def render_security_settings():
     """Render the security settings page."""
@@ -428,20 +429,11 @@ def render_security_settings():
     _render_run_as_accounts()
     
     # Compile configuration for validation
-    security_config = {
-        "host_hardening": host_hardening,
-        "network_isolation": network_isolation,
-        "ipsec_migration": ipsec_migration,
-        "smb_encryption": smb_encryption,
-        "dkm": {
-            "enabled": dkm_enabled,
-            "container_name": dkm_container
-        },
-        "code_integrity": code_integrity,
-        "update_policy": update_policy,
-        "password_policy": password_policy,
-        "roles": len(roles) > 0
-    }
+    security_config = build_security_config(
+        host_hardening, network_isolation, ipsec_migration, smb_encryption,
+        dkm_enabled, dkm_container, code_integrity, update_policy,
+        password_policy, len(roles) > 0
+    )
     
     # Security validation section
     st.header("Security Configuration Validation")
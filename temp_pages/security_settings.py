@@ -1,15 +1,32 @@
+import json
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-from utils.security_validator import (
-    validate_security_configuration,
-    validate_admin_account,
-    create_security_visualization,
-    generate_security_recommendations
-)
+from collections import defaultdict
+
+_BEST_PRACTICES = [
+    "Use the principle of least privilege for all accounts",
+    "Implement role-based access control",
+    "Keep all systems updated with security patches",
+    "Use encrypted communications for sensitive traffic",
+    "Implement secure boot and code integrity where possible",
+    "Regularly audit and review access permissions",
+    "Use strong password policies",
+    "Configure Distributed Key Management for encryption key security",
+    "Isolate different network traffic types",
+    "Regularly back up Active Directory to protect DKM keys"
+]
 
 def render_security_settings():
     """Render the security settings page."""
+    # Imported here so the heavy dependencies are only loaded when the page is visited
+    import pandas as pd
+    from utils.security_validator import (
+        build_security_config,
+        validate_security_configuration,
+        validate_admin_account,
+        create_security_visualization,
+        generate_security_recommendations
+    )
+    
     st.title("Security Settings")
     
     st.write("Configure security settings for your VMM cluster. Proper security configuration is essential for protecting your virtualization environment.")
@@ -39,7 +56,15 @@ def render_security_settings():
             "code_integrity": code_integrity,
             "update_policy": update_policy,
             "password_policy": password_policy,
-            "roles": roles,
+            "roles": roles + [
+                {
+                    "name": name,
+                    "description": description,
+                    "permissions": permissions,
+                    "custom": True
+                }
+                for name, description, permissions in custom_roles
+            ],
             "dkm_container": dkm_container
         }
         
@@ -196,8 +221,10 @@ def render_security_settings():
         }
     ]
     
-    # Allow customization of default roles
+    # Allow customization of default roles; custom roles are kept as
+    # (name, description, permissions) tuples until the configuration is confirmed
     roles = []
+    custom_roles = []
     
     with st.expander("Role-Based Access Control Configuration", expanded=False):
         st.write("Configure the roles for your VMM environment.")
@@ -205,14 +232,11 @@ def render_security_settings():
         # Table of standard roles
         st.subheader("Standard Roles")
         
-        standard_roles_df = pd.DataFrame([
-            {
-                "Name": role["name"],
-                "Description": role["description"],
-                "Permissions": role["permissions"]
-            }
-            for role in default_roles
-        ])
+        standard_roles_df = pd.DataFrame({
+            "Name": [role["name"] for role in default_roles],
+            "Description": [role["description"] for role in default_roles],
+            "Permissions": [role["permissions"] for role in default_roles]
+        })
         
         st.table(standard_roles_df)
         
@@ -252,12 +276,7 @@ def render_security_settings():
                     )
                     
                     # Add to roles
-                    roles.append({
-                        "name": role_name,
-                        "description": role_desc,
-                        "permissions": role_perms,
-                        "custom": True
-                    })
+                    custom_roles.append((role_name, role_desc, role_perms))
     
     # Run As Accounts
     st.header("Run As Accounts")
@@ -290,23 +309,20 @@ def render_security_settings():
     st.header("Security Configuration Validation")
     
     # Compile configuration for validation
-    security_config = {
-        "host_hardening": host_hardening,
-        "network_isolation": network_isolation,
-        "ipsec_migration": ipsec_migration,
-        "smb_encryption": smb_encryption,
-        "dkm": {
-            "enabled": dkm_enabled,
-            "container_name": dkm_container
-        },
-        "code_integrity": code_integrity,
-        "update_policy": update_policy,
-        "password_policy": password_policy,
-        "roles": len(roles) > 0
-    }
+    security_config = build_security_config(
+        host_hardening, network_isolation, ipsec_migration, smb_encryption,
+        dkm_enabled, dkm_container, code_integrity, update_policy,
+        password_policy, len(roles) + len(custom_roles) > 0
+    )
     
-    # Validate security configuration
-    validation_results = validate_security_configuration(security_config)
+    # Validate security configuration, reusing the previous result if nothing changed
+    config_key = json.dumps(security_config, sort_keys=True, default=str)
+    if st.session_state.get("_security_validation_key") == config_key:
+        validation_results = st.session_state["_security_validation_results"]
+    else:
+        validation_results = validate_security_configuration(security_config)
+        st.session_state["_security_validation_key"] = config_key
+        st.session_state["_security_validation_results"] = validation_results
     
     # Display validation results
     if not validation_results["status"]:
@@ -323,9 +339,14 @@ def render_security_settings():
     # Security visualization
     st.subheader("Security Configuration Visualization")
     
-    # Create security visualization
-    fig = create_security_visualization(security_config)
-    st.plotly_chart(fig)
+    # Create security visualization, reusing the cached figure for an unchanged configuration
+    if st.session_state.get("_security_figure_key") == config_key:
+        fig = st.session_state["_security_figure"]
+    else:
+        fig = create_security_visualization(security_config)
+        st.session_state["_security_figure_key"] = config_key
+        st.session_state["_security_figure"] = fig
+    st.plotly_chart(fig, use_container_width=True)
     
     # Security recommendations
     st.header("Security Recommendations")
@@ -334,41 +355,27 @@ def render_security_settings():
     recommendations = generate_security_recommendations(security_config)
     
     # Group recommendations by category
-    by_category = {}
+    by_category = defaultdict(list)
     for rec in recommendations:
-        category = rec["category"]
-        if category not in by_category:
-            by_category[category] = []
-        by_category[category].append(rec)
+        by_category[rec["category"]].append(rec)
     
     # Display recommendations by category
     for category, recs in by_category.items():
         with st.expander(f"{category} Recommendations", expanded=True):
-            for rec in recs:
-                st.subheader(rec["title"])
-                st.write(rec["description"])
-                st.markdown(f"**Impact:** {rec['impact']}")
-                st.markdown(f"**Implementation:** {rec['implementation']}")
-                st.markdown("---")
+            # Emit each category as a single markdown element
+            st.markdown("\n\n".join(
+                f"### {rec['title']}\n\n"
+                f"{rec['description']}\n\n"
+                f"**Impact:** {rec['impact']}\n\n"
+                f"**Implementation:** {rec['implementation']}\n\n"
+                "---"
+                for rec in recs
+            ))
     
     # Security best practices
     st.header("Security Best Practices")
     
-    best_practices = [
-        "Use the principle of least privilege for all accounts",
-        "Implement role-based access control",
-        "Keep all systems updated with security patches",
-        "Use encrypted communications for sensitive traffic",
-        "Implement secure boot and code integrity where possible",
-        "Regularly audit and review access permissions",
-        "Use strong password policies",
-        "Configure Distributed Key Management for encryption key security",
-        "Isolate different network traffic types",
-        "Regularly back up Active Directory to protect DKM keys"
-    ]
-    
-    for practice in best_practices:
-        st.markdown(f"- {practice}")
+    st.markdown("\n".join(f"- {practice}" for practice in _BEST_PRACTICES))
     
     # Navigation buttons
     st.markdown("---")
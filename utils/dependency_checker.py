@@ -1,35 +1,37 @@
 import importlib
+import importlib.util
 import subprocess
 import sys
 import os
 import pkg_resources
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Upper bound for concurrent pip download processes
+MAX_PARALLEL_INSTALLS = 8
+
+# Required packages (already lowercase, matching pkg_resources keys)
+_REQUIRED_PACKAGES = (
+    'streamlit',
+    'pandas',
+    'plotly',
+    'networkx',
+    'jinja2',
+    'pyyaml',
+    'psutil',
+    'requests',
+    'streamlit_option_menu'
+)
 
 def check_dependencies():
     """
     Check if all required dependencies are installed.
     Returns a dictionary with status and list of missing dependencies.
     """
-    required_packages = [
-        'streamlit',
-        'pandas',
-        'plotly',
-        'networkx',
-        'jinja2',
-        'pyyaml',
-        'psutil',
-        'requests',
-        'streamlit_option_menu'
-    ]
-    
-    # Try to check for Windows-specific dependencies if on Windows
-    if os.name == 'nt':
-        required_packages.append('wmi')
-    
     # Check installed packages
     installed_packages = {pkg.key for pkg in pkg_resources.working_set}
     
     # First pass based on pkg_resources
-    missing_packages = [pkg for pkg in required_packages if pkg.lower() not in installed_packages]
+    missing_packages = [pkg for pkg in _REQUIRED_PACKAGES if pkg not in installed_packages]
     
     # Second pass using direct import check for more reliability
     for pkg in list(missing_packages):  # Use list() to create a copy as we might modify it
@@ -48,21 +50,14 @@ def check_dependencies():
             # Keep it in the missing list
             pass
     
-    # Special Windows handling for WMI
-    if os.name == 'nt' and 'wmi' not in installed_packages:
-        try:
-            importlib.import_module('wmi')
-            # If we get here, WMI is installed but not listed in pip packages
-            if 'wmi' in missing_packages:
-                missing_packages.remove('wmi')
-        except ImportError:
-            if 'wmi' not in missing_packages:
-                missing_packages.append('wmi')
+    # Windows-specific dependency, detected without importing it
+    if os.name == 'nt' and importlib.util.find_spec('wmi') is None:
+        missing_packages.append('wmi')
     
     return {
         "status": len(missing_packages) == 0,
         "missing": missing_packages,
-        "installed": list(installed_packages)
+        "installed_count": len(installed_packages)
     }
 
 def install_dependency(package_name):
@@ -76,6 +71,44 @@ def install_dependency(package_name):
     except subprocess.CalledProcessError:
         return False
 
+def download_dependency(package_name, download_dir):
+    """
+    Download a dependency into download_dir using pip.
+    Returns True if successful, False otherwise.
+    """
+    try:
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "download", 
+            "--dest", download_dir, package_name
+        ])
+        return True
+    except subprocess.CalledProcessError:
+        return False
+
+def _run_pip(*args):
+    """
+    Run a single pip command with the given arguments.
+    pip's output goes to the console, so failures can be diagnosed there.
+    Returns True if pip exited successfully, False otherwise.
+    """
+    result = subprocess.run([sys.executable, "-m", "pip", *args], check=False)
+    return result.returncode == 0
+
+def _run_per_package(func, packages, *args):
+    """
+    Run func(package, *args) for every package concurrently.
+    Returns the list of packages for which func returned False.
+    """
+    failed = []
+    # pip spends most of its time waiting on the network, so run the calls concurrently;
+    # only use this for commands that don't write to site-packages, such as downloads
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_INSTALLS, len(packages))) as executor:
+        futures = {executor.submit(func, pkg, *args): pkg for pkg in packages}
+        for future in as_completed(futures):
+            if not future.result():
+                failed.append(futures[future])
+    return failed
+
 def install_all_dependencies():
     """
     Install all missing dependencies.
@@ -85,10 +118,13 @@ def install_all_dependencies():
     if dependency_check["status"]:
         return {"status": True, "message": "All dependencies already installed"}
     
+    missing = dependency_check["missing"]
     failed_installations = []
-    for package in dependency_check["missing"]:
-        if not install_dependency(package):
-            failed_installations.append(package)
+    # One pip run resolves everything at once; only retry per package if it fails.
+    # The retries run one at a time, since concurrent pip installs into the same
+    # site-packages race on shared dependencies
+    if not _run_pip("install", *missing):
+        failed_installations = [pkg for pkg in missing if not install_dependency(pkg)]
     
     return {
         "status": len(failed_installations) == 0,
@@ -105,19 +141,22 @@ def get_offline_installation_script():
         return "# All dependencies are already installed"
     
     script_lines = ["# Offline dependency installation script", ""]
+    install_line = "pip install " + " ".join(dependencies["missing"])
     
     if os.name == 'nt':  # Windows
-        script_lines.append("@echo off")
-        script_lines.append("echo Installing dependencies...")
-        for pkg in dependencies["missing"]:
-            script_lines.append(f"pip install {pkg}")
-        script_lines.append("echo Installation complete!")
+        script_lines.extend([
+            "@echo off",
+            "echo Installing dependencies...",
+            install_line,
+            "echo Installation complete!"
+        ])
     else:  # Linux/macOS
-        script_lines.append("#!/bin/bash")
-        script_lines.append("echo 'Installing dependencies...'")
-        for pkg in dependencies["missing"]:
-            script_lines.append(f"pip install {pkg}")
-        script_lines.append("echo 'Installation complete!'")
+        script_lines.extend([
+            "#!/bin/bash",
+            "echo 'Installing dependencies...'",
+            install_line,
+            "echo 'Installation complete!'"
+        ])
     
     return "\n".join(script_lines)
 
@@ -133,15 +172,10 @@ def download_offline_packages():
     download_dir = os.path.join(os.getcwd(), "offline_packages")
     os.makedirs(download_dir, exist_ok=True)
     
+    missing = dependencies["missing"]
     failed_downloads = []
-    for package in dependencies["missing"]:
-        try:
-            subprocess.check_call([
-                sys.executable, "-m", "pip", "download", 
-                "--dest", download_dir, package
-            ])
-        except subprocess.CalledProcessError:
-            failed_downloads.append(package)
+    if not _run_pip("download", "--dest", download_dir, *missing):
+        failed_downloads = _run_per_package(download_dependency, missing, download_dir)
     
     return {
         "status": len(failed_downloads) == 0,
@@ -1,8 +1,65 @@
 import plotly.graph_objects as go
-import pandas as pd
-import networkx as nx
 import re
 import math
+# google-re2 matches in guaranteed linear time; fall back to re when it isn't installed
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Required fields are kept in report order, so they are tuples rather than sets
+_HA_REQUIRED_FIELDS = ("enabled", "cluster")
+_VMM_REQUIRED_FIELDS = ("vmm_service_account",)
+
+_DOMAIN_RE = _re_engine.compile(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_VALID_QUORUM_TYPES = frozenset({"NodeMajority", "NodeAndDiskMajority", "NodeAndFileShareMajority", "NodeAndCloudWitness"})
+_VALID_WITNESS_TYPES = frozenset({"DiskWitness", "FileShareWitness", "CloudWitness"})
+
+# Marker color and size per node group in the HA visualization
+_NODE_STYLES = {
+    "cluster": ('#1f77b4', 30),  # Blue for cluster nodes
+    "cluster_service": ('#1C5631', 35),  # Bechtle green for cluster service
+    "service": ('#2ca02c', 35),  # Green for services
+    "other": ('#ff7f0e', 30)  # Orange for other resources
+}
+
+def _check_node_count(node_count, cluster, results):
+    """
+    Check the cluster node count against the supported range.
+    """
+    if node_count is None:
+        return
+    if node_count < 2:
+        results["errors"].append("Cluster requires at least 2 nodes")
+        results["status"] = False
+    elif node_count > 64:
+        results["warnings"].append("Large clusters (>16 nodes) may have performance implications")
+
+def _check_quorum_type(quorum_type, cluster, results):
+    """
+    Warn about quorum types outside the standard set.
+    """
+    if quorum_type not in _VALID_QUORUM_TYPES:
+        results["warnings"].append(f"Quorum type '{quorum_type}' is not a standard quorum type")
+
+def _check_witness_type(witness_type, cluster, results):
+    """
+    Warn about non-standard witness types and a missing witness resource.
+    """
+    if witness_type not in _VALID_WITNESS_TYPES:
+        results["warnings"].append(f"Witness type '{witness_type}' is not a standard witness type")
+    
+    # Validate witness resource if applicable
+    if witness_type != "None" and "witness_resource" not in cluster:
+        results["warnings"].append("Witness resource should be specified for the selected witness type")
+
+# Required cluster fields and the check applied to each one that is present
+_CLUSTER_RULES = (
+    ("name", None),
+    ("node_count", _check_node_count),
+    ("quorum_type", _check_quorum_type),
+    ("witness_type", _check_witness_type)
+)
 
 def validate_ha_configuration(config):
     """
@@ -17,12 +74,7 @@ def validate_ha_configuration(config):
     }
     
     # Check required fields
-    required_fields = [
-        "enabled", 
-        "cluster"
-    ]
-    
-    for field in required_fields:
+    for field in _HA_REQUIRED_FIELDS:
         if field not in config:
             results["errors"].append(f"Missing required high availability configuration: {field}")
             results["status"] = False
@@ -30,81 +82,57 @@ def validate_ha_configuration(config):
     if not results["status"]:
         return results
     
-    # Validate cluster configuration if enabled
-    if config["enabled"]:
-        cluster_fields = ["name", "node_count", "quorum_type", "witness_type"]
-        
-        for field in cluster_fields:
-            if field not in config["cluster"]:
-                results["errors"].append(f"Missing required cluster configuration: {field}")
-                results["status"] = False
-        
-        # Validate node count
-        if "node_count" in config["cluster"]:
-            node_count = config["cluster"]["node_count"]
-            if node_count < 2:
-                results["errors"].append("Cluster requires at least 2 nodes")
+    # Nothing else applies while high availability is disabled
+    if not config["enabled"]:
+        results["recommendations"].append("Enable high availability for production environments")
+        return results
+    
+    cluster = config["cluster"]
+    
+    # Validate cluster configuration
+    for field, _ in _CLUSTER_RULES:
+        if field not in cluster:
+            results["errors"].append(f"Missing required cluster configuration: {field}")
+            results["status"] = False
+    
+    for field, check in _CLUSTER_RULES:
+        if check and field in cluster:
+            check(cluster[field], cluster, results)
+    
+    # Check if VMM is used, and if so validate VMM-specific fields
+    use_vmm = config.get("use_vmm")
+    if use_vmm:
+        # Check VMM-specific required fields when VMM is enabled
+        for field in _VMM_REQUIRED_FIELDS:
+            if not config.get(field):
+                results["errors"].append(f"Missing required VMM configuration: {field}")
                 results["status"] = False
-            elif node_count > 64:
-                results["warnings"].append("Large clusters (>16 nodes) may have performance implications")
-                
-        # Check if VMM is used, and if so validate VMM-specific fields
-        if "use_vmm" in config and config["use_vmm"]:
-            # Check VMM-specific required fields when VMM is enabled
-            vmm_required_fields = ["vmm_service_account"]
-            for field in vmm_required_fields:
-                if field not in config or not config[field]:
-                    results["errors"].append(f"Missing required VMM configuration: {field}")
-                    results["status"] = False
-        
-        # Validate quorum type
-        if "quorum_type" in config["cluster"]:
-            valid_quorum_types = ["NodeMajority", "NodeAndDiskMajority", "NodeAndFileShareMajority", "NodeAndCloudWitness"]
-            if config["cluster"]["quorum_type"] not in valid_quorum_types:
-                results["warnings"].append(f"Quorum type '{config['cluster']['quorum_type']}' is not a standard quorum type")
-        
-        # Validate witness type
-        if "witness_type" in config["cluster"]:
-            valid_witness_types = ["DiskWitness", "FileShareWitness", "CloudWitness"]
-            if config["cluster"]["witness_type"] not in valid_witness_types:
-                results["warnings"].append(f"Witness type '{config['cluster']['witness_type']}' is not a standard witness type")
-        
-        # Validate witness resource if applicable
-        if "witness_type" in config["cluster"] and config["cluster"]["witness_type"] != "None":
-            if "witness_resource" not in config["cluster"]:
-                results["warnings"].append("Witness resource should be specified for the selected witness type")
     
     # VMM-specific validations only if VMM is being used
-    if "use_vmm" in config and config["use_vmm"]:
+    if use_vmm:
         # Validate VMM service account
-        if "vmm_service_account" in config:
-            account = config["vmm_service_account"]
-            
-            # Check domain format (domain\user)
-            if account and "\\" not in account and "@" not in account:
-                results["warnings"].append("VMM service account should be in domain\\username or username@domain format")
+        account = config.get("vmm_service_account")
+        
+        # Check domain format (domain\user)
+        if account and "\\" not in account and "@" not in account:
+            results["warnings"].append("VMM service account should be in domain\\username or username@domain format")
         
         # Validate library high availability
-        if "library_ha" in config and config["library_ha"]:
-            if "library_share" not in config:
-                results["warnings"].append("High availability library share should be specified")
+        if config.get("library_ha") and "library_share" not in config:
+            results["warnings"].append("High availability library share should be specified")
         
         # Add VMM-specific recommendations based on best practices
-        if "vmm_db_ha" not in config or not config["vmm_db_ha"]:
+        if not config.get("vmm_db_ha"):
             results["recommendations"].append("Configure high availability for the VMM database")
         
-        if "dkm_enabled" not in config or not config["dkm_enabled"]:
+        if not config.get("dkm_enabled"):
             results["recommendations"].append("Configure Distributed Key Management for HA VMM environments")
         
-        if "library_ha" not in config or not config["library_ha"]:
+        if not config.get("library_ha"):
             results["recommendations"].append("Configure highly available VMM library")
     
-    # General HA recommendations (regardless of VMM)
-    if not config.get("enabled", False):
-        results["recommendations"].append("Enable high availability for production environments")
-    
     # If node count is low, recommend additional nodes
-    if "cluster" in config and "node_count" in config["cluster"] and config["cluster"]["node_count"] < 3:
+    if "node_count" in cluster and cluster["node_count"] < 3:
         results["recommendations"].append("Add additional nodes to the cluster for better availability")
     
     return results
@@ -127,9 +155,8 @@ def validate_service_account(account):
         return results
     
     # Check domain format (domain\user or user@domain)
-    if "\\" in account:
-        domain, username = account.split("\\", 1)
-        
+    domain, sep, username = account.partition("\\")
+    if sep:
         if not domain:
             results["errors"].append("Domain name cannot be empty")
             results["status"] = False
@@ -139,31 +166,32 @@ def validate_service_account(account):
             results["status"] = False
         elif len(username) < 3:
             results["warnings"].append("Username should be at least 3 characters long")
-    elif "@" in account:
-        username, domain = account.split("@", 1)
-        
-        if not username:
-            results["errors"].append("Username cannot be empty")
-            results["status"] = False
-        elif len(username) < 3:
-            results["warnings"].append("Username should be at least 3 characters long")
-        
-        if not domain:
-            results["errors"].append("Domain name cannot be empty")
-            results["status"] = False
-        
-        # Validate domain format
-        if domain and not re.match(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', domain):
-            results["warnings"].append("Domain format appears to be invalid")
     else:
-        results["errors"].append("Service account should be in domain\\username or username@domain format")
-        results["status"] = False
+        username, sep, domain = account.partition("@")
+        if sep:
+            if not username:
+                results["errors"].append("Username cannot be empty")
+                results["status"] = False
+            elif len(username) < 3:
+                results["warnings"].append("Username should be at least 3 characters long")
+            
+            if not domain:
+                results["errors"].append("Domain name cannot be empty")
+                results["status"] = False
+            
+            # Validate domain format
+            if domain and not _DOMAIN_RE.match(domain):
+                results["warnings"].append("Domain format appears to be invalid")
+        else:
+            results["errors"].append("Service account should be in domain\\username or username@domain format")
+            results["status"] = False
     
     # Check for service account best practices
-    if "admin" in account.lower():
+    account_lower = account.lower()
+    if "admin" in account_lower:
         results["warnings"].append("Avoid using 'admin' in service account names for security")
     
-    if account.lower().startswith("administrator"):
+    if account_lower.startswith("administrator"):
         results["warnings"].append("Do not use built-in Administrator account for services")
     
     results["recommendations"].append("Ensure service account has the minimum required permissions")
@@ -176,86 +204,78 @@ def create_ha_visualization(config):
     Create a visual representation of the high availability configuration.
     Returns a Plotly figure.
     """
-    # Create a graph
-    G = nx.Graph()
+    cluster = config.get("cluster") or {}
+    use_vmm = config.get("use_vmm", False)
+    library_ha = use_vmm and config.get("library_ha", False)
+    witness_type = cluster.get("witness_type", None)
+    has_witness = bool(witness_type) and witness_type != "None"
     
-    # Add nodes based on configuration
-    nodes = []
+    # Collect the nodes and their connections; each node name is built once
+    # and reused for positions, edges and labels
+    edges = []
     
     # Add cluster nodes
-    node_count = config.get("cluster", {}).get("node_count", 2)
-    for i in range(node_count):
-        nodes.append(f"Node{i+1}")
-        G.add_node(f"Node{i+1}")
+    node_count = cluster.get("node_count", 2)
+    nodes = [f"Node{i+1}" for i in range(node_count)]
     
-    # Add shared cluster resources
-    G.add_node("Cluster Service")
+    # Shared resources, grouped by the trace they are drawn in
+    services = []
+    others = []
     
     # Add VMM-specific resources if VMM is used
-    if config.get("use_vmm", False):
-        G.add_node("VMM Service")
-        G.add_node("SQL Database")
+    if use_vmm:
+        services.append("VMM Service")
+        services.append("SQL Database")
         
         # Add library if HA configured with VMM
-        if config.get("library_ha", False):
-            G.add_node("HA Library")
+        if library_ha:
+            others.append("HA Library")
     
     # Add witness if applicable
-    witness_type = config.get("cluster", {}).get("witness_type", None)
-    if witness_type and witness_type != "None":
-        G.add_node(f"{witness_type}")
+    if has_witness:
+        others.append(witness_type)
     
-    # Add edges (connections)
+    resources = ["Cluster Service"] + services + others
+    
+    # Every cluster node connects to every shared resource
     for node in nodes:
-        # All nodes connect to cluster service
-        G.add_edge(node, "Cluster Service")
-        
-        # VMM-specific connections
-        if config.get("use_vmm", False):
-            G.add_edge(node, "VMM Service")
-            G.add_edge(node, "SQL Database")
-            
-            if config.get("library_ha", False):
-                G.add_edge(node, "HA Library")
-        
-        # Witness connection if applicable
-        if witness_type and witness_type != "None":
-            G.add_edge(node, f"{witness_type}")
+        for resource in resources:
+            edges.append((node, resource))
     
     # Create positions for better visualization
     pos = {}
     
     # Position nodes in a circle
-    angle_step = 2 * 3.14159 / node_count
+    angle_step = math.tau / node_count
     radius = 3
     
-    for i in range(node_count):
-        angle = i * angle_step
-        pos[f"Node{i+1}"] = [radius * 1.5 * math.cos(angle), radius * math.sin(angle)]
+    cluster_x = [radius * 1.5 * math.cos(i * angle_step) for i in range(node_count)]
+    cluster_y = [radius * math.sin(i * angle_step) for i in range(node_count)]
+    for node, x, y in zip(nodes, cluster_x, cluster_y):
+        pos[node] = [x, y]
     
     # Position cluster service in the center
     pos["Cluster Service"] = [0, 0]
     
     # Position VMM-specific resources if used
-    if config.get("use_vmm", False):
+    if use_vmm:
         pos["VMM Service"] = [0, -1.5]
         pos["SQL Database"] = [0, -2.5]
         
-        if config.get("library_ha", False):
+        if library_ha:
             pos["HA Library"] = [-2, -1]
     
     # Position witness if applicable
-    if witness_type and witness_type != "None":
-        pos[f"{witness_type}"] = [2, -1]
-    
-    # Create edge traces
-    edge_x = []
-    edge_y = []
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
+    if has_witness:
+        pos[witness_type] = [2, -1]
+    
+    # Create edge traces (None separates the line segments)
+    edge_x = [None] * (3 * len(edges))
+    edge_y = [None] * (3 * len(edges))
+    for i, (a, b) in enumerate(edges):
+        j = 3 * i
+        edge_x[j], edge_y[j] = pos[a]
+        edge_x[j + 1], edge_y[j + 1] = pos[b]
     
     edge_trace = go.Scatter(
         x=edge_x, y=edge_y,
@@ -263,91 +283,42 @@ def create_ha_visualization(config):
         hoverinfo='none',
         mode='lines')
     
-    # Create node traces with different colors per type
-    node_trace_cluster = go.Scatter(
-        x=[pos[node][0] for node in G.nodes() if node.startswith("Node")],
-        y=[pos[node][1] for node in G.nodes() if node.startswith("Node")],
-        text=[node for node in G.nodes() if node.startswith("Node")],
-        mode='markers+text',
-        textposition="bottom center",
-        hoverinfo='text',
-        marker=dict(
-            color='#1f77b4',  # Blue for cluster nodes
-            size=30,
-            line_width=2
-        )
-    )
-    
-    # Set up the services to include in the visualization
-    vmm_services = []
-    if config.get("use_vmm", False):
-        vmm_services = ["VMM Service", "SQL Database"]
-    
-    # Cluster service visualization
-    node_trace_cluster_service = go.Scatter(
-        x=[pos["Cluster Service"][0]],
-        y=[pos["Cluster Service"][1]],
-        text=["Cluster Service"],
-        mode='markers+text',
-        textposition="bottom center",
-        hoverinfo='text',
-        marker=dict(
-            color='#1C5631',  # Bechtle green for cluster service
-            size=35,
-            line_width=2
-        )
-    )
-    
-    # VMM services visualization (only if VMM is used)
-    node_trace_services = go.Scatter(
-        x=[pos[node][0] for node in G.nodes() if node in vmm_services],
-        y=[pos[node][1] for node in G.nodes() if node in vmm_services],
-        text=[node for node in G.nodes() if node in vmm_services],
+    # Create a single node trace, colored and sized per node group
+    node_x = []
+    node_y = []
+    node_text = []
+    node_colors = []
+    node_sizes = []
+    
+    for group, group_nodes in (("cluster", nodes), ("cluster_service", ["Cluster Service"]),
+                               ("service", services), ("other", others)):
+        color, size = _NODE_STYLES[group]
+        for node in group_nodes:
+            x, y = pos[node]
+            node_x.append(x)
+            node_y.append(y)
+            node_text.append(node)
+            node_colors.append(color)
+            node_sizes.append(size)
+    
+    node_trace = go.Scatter(
+        x=node_x, y=node_y,
+        text=node_text,
         mode='markers+text',
         textposition="bottom center",
         hoverinfo='text',
         marker=dict(
-            color='#2ca02c',  # Green for services
-            size=35,
-            line_width=2
-        )
-    )
-    
-    # Other resources (witness, library)
-    other_resources = []
-    for node in G.nodes():
-        if (node not in vmm_services and 
-            node != "Cluster Service" and 
-            not node.startswith("Node")):
-            other_resources.append(node)
-    
-    node_trace_other = go.Scatter(
-        x=[pos[node][0] for node in other_resources],
-        y=[pos[node][1] for node in other_resources],
-        text=other_resources,
-        mode='markers+text',
-        textposition="bottom center",
-        hoverinfo='text',
-        marker=dict(
-            color='#ff7f0e',  # Orange for other resources
-            size=30,
+            color=node_colors,
+            size=node_sizes,
             line_width=2
         )
     )
     
     # Create the figure with all traces
-    traces = [edge_trace, node_trace_cluster, node_trace_cluster_service]
-    
-    # Only add services trace if VMM is used and there are services to show
-    if config.get("use_vmm", False) and vmm_services:
-        traces.append(node_trace_services)
-    
-    # Only add other resources trace if there are other resources to show
-    if other_resources:
-        traces.append(node_trace_other)
+    traces = [edge_trace, node_trace]
     
     # Use a cluster-focused title
-    cluster_name = config.get('cluster', {}).get('name', 'Hyper-V Cluster')
+    cluster_name = cluster.get('name', 'Hyper-V Cluster')
     
     fig = go.Figure(data=traces,
                    layout=go.Layout(
@@ -363,7 +334,7 @@ def create_ha_visualization(config):
                    ))
     
     # Add annotations for quorum information
-    quorum_type = config.get("cluster", {}).get("quorum_type", "Not specified")
+    quorum_type = cluster.get("quorum_type", "Not specified")
     fig.add_annotation(
         x=pos["Cluster Service"][0],
         y=pos["Cluster Service"][1] - 0.7,
@@ -1,8 +1,20 @@
 """
 Navigation utility functions to ensure consistent navigation between pages.
 """
+import functools
 import streamlit as st
 
+# Page order used by the step indices
+_NAV_STEPS = (
+    "introduction",
+    "installation",
+    "hardware",
+    "software",
+    "network",
+    "storage",
+    "documentation"
+)
+
 def create_navigation_callback(step_index):
     """
     Create a callback function for navigation buttons.
@@ -14,44 +26,27 @@ def create_navigation_callback(step_index):
     Returns:
         A callback function that updates the current_step in session state
     """
-    def navigate():
-        st.session_state.current_step = step_index
-    return navigate
+    return functools.partial(go_to_step, step_index)
 
 def go_to_step(step_index):
     """
     Update the current step in the session state without a rerun.
     This provides a more direct way to navigate between steps.
+    Navigating to the step that is already shown leaves the session state untouched.
     
     Args:
         step_index: The index of the step to navigate to
     """
+    if st.session_state.get("current_step") == step_index:
+        return
     st.session_state.current_step = step_index
 
-def go_to_introduction():
-    """Navigate to the Introduction page"""
-    go_to_step(0)
-    
-def go_to_installation():
-    """Navigate to the Installation page"""
-    go_to_step(1)
-    
-def go_to_hardware():
-    """Navigate to the Hardware Requirements page"""
-    go_to_step(2)
-    
-def go_to_software():
-    """Navigate to the Software Requirements page"""
-    go_to_step(3)
-    
-def go_to_network():
-    """Navigate to the Network Configuration page"""
-    go_to_step(4)
-    
-def go_to_storage():
-    """Navigate to the Storage Configuration page"""
-    go_to_step(5)
-    
-def go_to_documentation():
-    """Navigate to the Documentation page"""
-    go_to_step(6)
\ No newline at end of file
+# Navigate to the Introduction, Installation, Hardware Requirements, Software Requirements,
+# Network Configuration, Storage Configuration and Documentation pages
+go_to_introduction = functools.partial(go_to_step, _NAV_STEPS.index("introduction"))
+go_to_installation = functools.partial(go_to_step, _NAV_STEPS.index("installation"))
+go_to_hardware = functools.partial(go_to_step, _NAV_STEPS.index("hardware"))
+go_to_software = functools.partial(go_to_step, _NAV_STEPS.index("software"))
+go_to_network = functools.partial(go_to_step, _NAV_STEPS.index("network"))
+go_to_storage = functools.partial(go_to_step, _NAV_STEPS.index("storage"))
+go_to_documentation = functools.partial(go_to_step, _NAV_STEPS.index("documentation"))
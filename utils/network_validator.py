@@ -2,10 +2,33 @@ import ipaddress
 import socket
 import subprocess
 import os
+import time
+import functools
+import selectors
+import errno
+import struct
 import plotly.graph_objects as go
-import pandas as pd
-import networkx as nx
 
+# Required network sections, in the order they are reported
+_REQUIRED_NETWORKS = ("management_network", "migration_network", "vm_network")
+
+# Reachability results are reused for this many seconds, so page reruns don't
+# repeat the same lookups
+_LOOKUP_TTL = 30
+_PORT_TTL = 10
+
+# Seconds to wait for port connections, and the connect_ex results that mean
+# a non-blocking connection attempt is still in progress
+_PORT_TIMEOUT = 2
+_CONNECT_PENDING = frozenset({0, errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)})
+
+# In-process ping: ICMP echo message types, payload and reply timeout in seconds
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_PING_PAYLOAD = b"VMMClusterAssistant"
+_PING_TIMEOUT = 1
+
+@functools.lru_cache(maxsize=256)
 def validate_ip_address(ip):
     """
     Validate an IP address.
@@ -17,6 +40,7 @@ def validate_ip_address(ip):
     except ValueError:
         return False, "Invalid IP address format"
 
+@functools.lru_cache(maxsize=256)
 def validate_subnet_mask(subnet):
     """
     Validate a subnet mask.
@@ -33,17 +57,46 @@ def validate_cidr(cidr):
     Validate a CIDR notation network.
     Returns a tuple of (is_valid, message).
     """
-    try:
-        ipaddress.ip_network(cidr)
+    if _parse_network(cidr) is not None:
         return True, "Valid CIDR notation"
+    return False, "Invalid CIDR notation"
+
+@functools.lru_cache(maxsize=256)
+def _parse_network(cidr):
+    """
+    Parse a CIDR notation network once per distinct string.
+    Returns the network object, or None if the notation is invalid.
+    """
+    try:
+        return ipaddress.ip_network(cidr)
     except ValueError:
-        return False, "Invalid CIDR notation"
+        return None
 
 def ping_host(host):
     """
     Check if a host is reachable via ping.
     Returns a tuple of (is_reachable, message).
     """
+    return _ping_host(host, int(time.time()) // _LOOKUP_TTL)
+
+@functools.lru_cache(maxsize=256)
+def _ping_host(host, bucket):
+    """
+    Ping a host once per TTL bucket.
+    Returns a tuple of (is_reachable, message).
+    """
+    try:
+        if _icmp_echo(host):
+            return True, "Host is reachable"
+        return False, "Host does not respond to ping"
+    except PermissionError:
+        # Raw ICMP sockets need elevated rights; use the ping command instead
+        pass
+    except socket.gaierror:
+        return False, "Failed to reach host"
+    except Exception as e:
+        return False, f"Error: {str(e)}"
+    
     param = "-n" if os.name == "nt" else "-c"
     command = ["ping", param, "1", host]
     
@@ -58,12 +111,61 @@ def ping_host(host):
     except Exception as e:
         return False, f"Error: {str(e)}"
 
+def _icmp_checksum(data):
+    """
+    Compute the Internet checksum of an ICMP packet.
+    Returns the 16-bit checksum.
+    """
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+def _icmp_echo(host):
+    """
+    Send a single ICMP echo request over a raw socket and wait for the reply.
+    Raises PermissionError if raw sockets are not allowed for this process.
+    Returns True if the host replied within the timeout.
+    """
+    address = socket.gethostbyname(host)
+    ident = os.getpid() & 0xFFFF
+    header = struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, 0, ident, 1)
+    packet = struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, _icmp_checksum(header + _PING_PAYLOAD), ident, 1) + _PING_PAYLOAD
+    
+    with socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP) as sock:
+        sock.sendto(packet, (address, 0))
+        deadline = time.monotonic() + _PING_TIMEOUT
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            sock.settimeout(remaining)
+            try:
+                reply, sender = sock.recvfrom(1024)
+            except socket.timeout:
+                return False
+            # Raw sockets deliver the IP header first; skip it to reach the ICMP header
+            offset = (reply[0] & 0x0F) * 4
+            icmp_type, _, _, reply_ident, _ = struct.unpack("!BBHHH", reply[offset:offset + 8])
+            if sender[0] == address and icmp_type == _ICMP_ECHO_REPLY and reply_ident == ident:
+                return True
+
 def resolve_hostname(hostname):
     """
     Resolve a hostname to an IP address.
     Returns a tuple of (is_resolved, result).
     Result can be an IP address or an error message.
     """
+    return _resolve_hostname(hostname, int(time.time()) // _LOOKUP_TTL)
+
+@functools.lru_cache(maxsize=256)
+def _resolve_hostname(hostname, bucket):
+    """
+    Resolve a hostname once per TTL bucket.
+    Returns a tuple of (is_resolved, result).
+    """
     try:
         ip = socket.gethostbyname(hostname)
         return True, ip
@@ -77,18 +179,76 @@ def check_port_open(host, port):
     Check if a specific port is open on a host.
     Returns a tuple of (is_open, message).
     """
+    return _check_port_open(host, port, int(time.time()) // _PORT_TTL)
+
+@functools.lru_cache(maxsize=256)
+def _check_port_open(host, port, bucket):
+    """
+    Probe a port once per TTL bucket.
+    Returns a tuple of (is_open, message).
+    """
+    return check_ports_open(host, [port])[port]
+
+def check_ports_open(host, ports):
+    """
+    Check several ports on a host at once.
+    All connection attempts run in parallel and share one timeout.
+    Returns a dictionary mapping each port to a tuple of (is_open, message).
+    """
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        result = sock.connect_ex((host, port))
-        sock.close()
-        
-        if result == 0:
-            return True, f"Port {port} is open"
-        else:
-            return False, f"Port {port} is closed"
+        address = socket.gethostbyname(host)
     except socket.error as e:
-        return False, f"Error checking port: {str(e)}"
+        return {port: (False, f"Error checking port: {str(e)}") for port in ports}
+    
+    results = {}
+    selector = selectors.DefaultSelector()
+    try:
+        for port in ports:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            try:
+                sock.setblocking(False)
+                result = sock.connect_ex((address, port))
+                if result in _CONNECT_PENDING:
+                    # From here on the selector owns the socket
+                    selector.register(sock, selectors.EVENT_WRITE, port)
+                    continue
+            except socket.error as e:
+                sock.close()
+                results[port] = (False, f"Error checking port: {str(e)}")
+                continue
+            except BaseException:
+                sock.close()
+                raise
+            sock.close()
+            results[port] = (False, f"Port {port} is closed")
+        
+        # A socket becomes writable once its connection attempt has finished
+        deadline = time.monotonic() + _PORT_TIMEOUT
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in selector.select(remaining):
+                sock, port = key.fileobj, key.data
+                if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    results[port] = (True, f"Port {port} is open")
+                else:
+                    results[port] = (False, f"Port {port} is closed")
+                selector.unregister(sock)
+                sock.close()
+        
+        # Anything still pending has timed out
+        for key in list(selector.get_map().values()):
+            results[key.data] = (False, f"Port {key.data} is closed")
+            selector.unregister(key.fileobj)
+            key.fileobj.close()
+    finally:
+        # Close every socket still registered if a check was interrupted
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+    
+    return results
 
 def validate_network_configuration(config):
     """
@@ -103,13 +263,7 @@ def validate_network_configuration(config):
     }
     
     # Check required fields
-    required_fields = [
-        "management_network", 
-        "migration_network", 
-        "vm_network"
-    ]
-    
-    for field in required_fields:
+    for field in _REQUIRED_NETWORKS:
         if field not in config:
             results["status"] = False
             results["errors"].append(f"Missing required network configuration: {field}")
@@ -145,16 +299,23 @@ def validate_network_configuration(config):
     networks = []
     for net_type, net_config in config.items():
         if isinstance(net_config, dict) and "cidr" in net_config:
-            try:
-                networks.append((net_type, ipaddress.ip_network(net_config["cidr"])))
-            except ValueError:
-                # Already caught above
-                pass
-    
-    for i, (type1, net1) in enumerate(networks):
-        for j, (type2, net2) in enumerate(networks):
-            if i != j and (net1.overlaps(net2) or net2.overlaps(net1)):
-                results["warnings"].append(f"Network overlap detected between {type1} and {type2}")
+            # Invalid notations were already reported above
+            net = _parse_network(net_config["cidr"])
+            if net is not None:
+                networks.append((net_type, net))
+    
+    # Sweep the address ranges by start; each network is compared only with the
+    # earlier ones that are still open, so every overlapping pair is reported once
+    ranges = sorted(
+        (net.version, int(net.network_address), int(net.broadcast_address), net_type)
+        for net_type, net in networks
+    )
+    open_ranges = []
+    for version, start, end, net_type in ranges:
+        open_ranges = [r for r in open_ranges if r[0] == version and r[2] >= start]
+        for other in open_ranges:
+            results["warnings"].append(f"Network overlap detected between {other[3]} and {net_type}")
+        open_ranges.append((version, start, end, net_type))
     
     # Add recommendations based on best practices
     if "dedicated_nics" not in config or not config["dedicated_nics"]:
@@ -173,40 +334,19 @@ def create_network_visualization(config):
     Create a visual representation of the network configuration.
     Returns a Plotly figure.
     """
-    # Create a graph
-    G = nx.Graph()
-    
-    # Define nodes
-    nodes = ["VMM Server", "SQL Server"]
-    
-    # Add Hyper-V hosts
     host_count = config.get("hyper_v_hosts", 2)
-    for i in range(host_count):
-        nodes.append(f"Hyper-V Host {i+1}")
-    
-    # Add network types
+    hosts = [f"Hyper-V Host {i+1}" for i in range(host_count)]
     networks = ["Management Network", "Migration Network", "VM Network"]
-    nodes.extend(networks)
-    
-    # Add all nodes to the graph
-    for node in nodes:
-        G.add_node(node)
-    
-    # Add edges
-    edges = []
     
-    # Connect VMM and SQL to Management Network
-    edges.append(("VMM Server", "Management Network"))
-    edges.append(("SQL Server", "Management Network"))
+    # Servers, Hyper-V hosts and network types
+    nodes = ["VMM Server", "SQL Server", *hosts, *networks]
     
-    # Connect all Hyper-V hosts to networks
-    for i in range(host_count):
-        host_name = f"Hyper-V Host {i+1}"
-        edges.append((host_name, "Management Network"))
-        edges.append((host_name, "Migration Network"))
-        edges.append((host_name, "VM Network"))
-    
-    G.add_edges_from(edges)
+    # VMM and SQL use the management network; every Hyper-V host uses all networks
+    edges = [
+        ("VMM Server", "Management Network"),
+        ("SQL Server", "Management Network"),
+        *((host, network) for host in hosts for network in networks)
+    ]
     
     # Create positions for better visualization
     pos = {
@@ -218,17 +358,16 @@ def create_network_visualization(config):
     }
     
     # Position Hyper-V hosts
-    for i in range(host_count):
-        pos[f"Hyper-V Host {i+1}"] = [-1 + 2 * (i % 2), -1 - (i // 2)]
+    for i, host in enumerate(hosts):
+        pos[host] = [-1 + 2 * (i % 2), -1 - (i // 2)]
     
-    # Create edge traces
-    edge_x = []
-    edge_y = []
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
+    # Create edge traces (None separates the line segments)
+    edge_x = [None] * (3 * len(edges))
+    edge_y = [None] * (3 * len(edges))
+    for i, (a, b) in enumerate(edges):
+        j = 3 * i
+        edge_x[j], edge_y[j] = pos[a]
+        edge_x[j + 1], edge_y[j + 1] = pos[b]
     
     edge_trace = go.Scatter(
         x=edge_x, y=edge_y,
@@ -243,7 +382,7 @@ def create_network_visualization(config):
     node_colors = []
     node_sizes = []
     
-    for node in G.nodes():
+    for node in nodes:
         x, y = pos[node]
         node_x.append(x)
         node_y.append(y)
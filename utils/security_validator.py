@@ -1,88 +1,242 @@
-import plotly.graph_objects as go
-import pandas as pd
-import re
+# pyahocorasick finds every pattern in a single pass; fall back to substring tests
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Substrings that mark a password as easy to guess, reported in this order
+_COMMON_PASSWORD_PATTERNS = ("123", "abc", "qwerty", "admin", "password", "welcome")
+
+def _build_password_automaton():
+    """
+    Build an Aho-Corasick automaton over the common password patterns.
+    Returns the automaton, or None if pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for rank, pattern in enumerate(_COMMON_PASSWORD_PATTERNS):
+        automaton.add_word(pattern, rank)
+    automaton.make_automaton()
+    return automaton
+
+# Short passwords are faster to check with plain substring tests
+_PASSWORD_AUTOMATON = _build_password_automaton()
+_AUTOMATON_MIN_LENGTH = 64
+
+# Shortest password accepted without a warning, for accounts and password policies
+_PASSWORD_MIN_LENGTH = 12
+
+# Password policy settings checked when present: (setting, test for a weak value, warning)
+_POLICY_RULES = (
+    ("min_length", lambda value: value is not None and value < _PASSWORD_MIN_LENGTH,
+     f"Password minimum length should be at least {_PASSWORD_MIN_LENGTH} characters"),
+    ("complexity", lambda value: not value, "Password complexity should be enabled")
+)
+
+# Security settings that should be present, and the recommendation added for each
+# setting that is missing or disabled (encryption checks come before the DKM check)
+_RECOMMENDED_FIELDS = ("host_hardening", "network_isolation", "dkm")
+_ENCRYPTION_CHECKS = (
+    ("smb_encryption", "Enable SMB 3.0 encryption for data protection"),
+    ("ipsec_migration", "Enable IPsec for Live Migration traffic")
+)
+_PRACTICE_CHECKS = (
+    ("roles", "Configure role-based access control (RBAC) for VMM management"),
+    ("code_integrity", "Enable code integrity policies for enhanced security"),
+    ("host_hardening", "Implement host hardening with minimal Windows Server installation"),
+    ("update_policy", "Establish a security update policy for all cluster components"),
+    ("network_isolation", "Implement network isolation for different traffic types")
+)
+
+# Security categories shown in the visualization and the config key behind each one
+_SECURITY_CATEGORIES = (
+    ("Host OS Hardening", "host_hardening"),
+    ("Network Isolation", "network_isolation"),
+    ("IPsec for Migration", "ipsec_migration"),
+    ("SMB Encryption", "smb_encryption"),
+    ("Distributed Key Management", "dkm"),
+    ("Role-Based Access", "roles"),
+    ("Code Integrity", "code_integrity"),
+    ("Update Policy", "update_policy")
+)
+_SECURITY_CATEGORY_KEYS = tuple(key for _, key in _SECURITY_CATEGORIES)
+
+# The figure layout and category labels never change
+_SECURITY_CATEGORY_LABELS = [category for category, _ in _SECURITY_CATEGORIES]
+# Bar value, color and label for a disabled and an enabled category
+_STATUS_STYLES = ((0, 'red', 'Disabled'), (1, 'green', 'Enabled'))
+
+_SECURITY_LAYOUT = dict(
+    title="Security Configuration Status",
+    yaxis=dict(
+        title="Status",
+        tickvals=[0, 1],
+        ticktext=["Disabled", "Enabled"],
+        range=[0, 1.2]
+    ),
+    height=500,
+    margin=dict(l=20, r=20, t=60, b=20)
+)
+
+# Recommendation shown for each security setting that is disabled, in display order
+_SECURITY_RECOMMENDATIONS = (
+    ("host_hardening", {
+        "category": "Host Security",
+        "title": "Implement host hardening",
+        "description": "Use minimal Windows Server installation to reduce attack surface.",
+        "impact": "High",
+        "implementation": "Install only required roles and features. Use security templates."
+    }),
+    ("network_isolation", {
+        "category": "Network Security",
+        "title": "Implement network isolation",
+        "description": "Separate networks for different traffic types.",
+        "impact": "High",
+        "implementation": "Use VLANs or physical separation for management, VM, and migration traffic."
+    }),
+    ("ipsec_migration", {
+        "category": "Network Security",
+        "title": "Enable IPsec for Live Migration",
+        "description": "Encrypt live migration traffic to protect VM data in transit.",
+        "impact": "Medium",
+        "implementation": "Configure IPsec on the live migration network interfaces."
+    }),
+    ("smb_encryption", {
+        "category": "Data Security",
+        "title": "Enable SMB 3.0 encryption",
+        "description": "Encrypt SMB traffic for end-to-end data protection.",
+        "impact": "Medium",
+        "implementation": "Configure SMB encryption on all file shares used by the cluster."
+    }),
+    ("dkm", {
+        "category": "Data Security",
+        "title": "Configure Distributed Key Management",
+        "description": "Securely store encryption keys in Active Directory.",
+        "impact": "High",
+        "implementation": "Set up DKM container in Active Directory and configure VMM to use it."
+    }),
+    ("roles", {
+        "category": "Access Control",
+        "title": "Implement role-based access control",
+        "description": "Restrict access based on job responsibilities.",
+        "impact": "High",
+        "implementation": "Define and assign appropriate VMM roles for different administrators."
+    }),
+    ("code_integrity", {
+        "category": "System Integrity",
+        "title": "Enable code integrity policies",
+        "description": "Prevent unauthorized code execution.",
+        "impact": "Medium",
+        "implementation": "Configure code integrity policies on all hosts."
+    }),
+    ("update_policy", {
+        "category": "System Integrity",
+        "title": "Establish update policy",
+        "description": "Keep systems updated with security patches.",
+        "impact": "High",
+        "implementation": "Define and implement a regular patching schedule for all components."
+    })
+)
+
+def build_security_config(host_hardening, network_isolation, ipsec_migration, smb_encryption,
+                          dkm_enabled, dkm_container, code_integrity, update_policy,
+                          password_policy, has_roles):
+    """
+    Build a normalized security configuration dictionary.
+    All flags are coerced to bool and numeric policy values to int, so equal
+    configurations always serialize identically and can be used as cache keys.
+    """
+    return {
+        "host_hardening": bool(host_hardening),
+        "network_isolation": bool(network_isolation),
+        "ipsec_migration": bool(ipsec_migration),
+        "smb_encryption": bool(smb_encryption),
+        "dkm": {
+            "enabled": bool(dkm_enabled),
+            "container_name": str(dkm_container or "")
+        },
+        "code_integrity": bool(code_integrity),
+        "update_policy": bool(update_policy),
+        "password_policy": {
+            "min_length": int(password_policy.get("min_length", 0)),
+            "complexity": bool(password_policy.get("complexity", False)),
+            "expiration_days": int(password_policy.get("expiration_days", 0)),
+            "history": int(password_policy.get("history", 0))
+        },
+        "roles": bool(has_roles)
+    }
+
+def _new_results():
+    """
+    Create an empty validation result.
+    Returns a dictionary that starts out valid, with no errors, warnings or recommendations.
+    """
+    return {"status": True, "errors": [], "warnings": [], "recommendations": []}
 
 def validate_security_configuration(config):
     """
     Validate a security configuration dictionary.
     Returns a dictionary with validation results.
     """
-    results = {
-        "status": True,
-        "errors": [],
-        "warnings": [],
-        "recommendations": []
-    }
+    results = _new_results()
+    get = config.get
     
     # Check required fields
-    required_fields = [
-        "host_hardening", 
-        "network_isolation",
-        "dkm"
-    ]
-    
-    for field in required_fields:
+    for field in _RECOMMENDED_FIELDS:
         if field not in config:
             results["warnings"].append(f"Missing recommended security configuration: {field}")
     
     # Validate password policy if provided
-    if "password_policy" in config:
-        policy = config["password_policy"]
-        
-        if "min_length" in policy and policy["min_length"] < 12:
-            results["warnings"].append("Password minimum length should be at least 12 characters")
-        
-        if "complexity" in policy and not policy["complexity"]:
-            results["warnings"].append("Password complexity should be enabled")
+    policy = get("password_policy")
+    if policy is not None:
+        for key, is_weak, message in _POLICY_RULES:
+            if key in policy and is_weak(policy[key]):
+                results["warnings"].append(message)
     
     # Validate encryption settings
-    if "smb_encryption" not in config or not config["smb_encryption"]:
-        results["recommendations"].append("Enable SMB 3.0 encryption for data protection")
-    
-    if "ipsec_migration" not in config or not config["ipsec_migration"]:
-        results["recommendations"].append("Enable IPsec for Live Migration traffic")
+    for key, message in _ENCRYPTION_CHECKS:
+        if not get(key):
+            results["recommendations"].append(message)
     
     # Validate Distributed Key Management (DKM)
-    if "dkm" in config and isinstance(config["dkm"], dict):
-        if not config["dkm"].get("enabled", False):
+    dkm = get("dkm")
+    if isinstance(dkm, dict):
+        if not dkm.get("enabled", False):
             results["recommendations"].append("Enabling Distributed Key Management (DKM) is recommended for secure encryption key storage")
-        elif "container_name" not in config["dkm"] or not config["dkm"]["container_name"]:
+        elif not dkm.get("container_name"):
             results["errors"].append("DKM container name must be specified when DKM is enabled")
             results["status"] = False
     else:
         results["recommendations"].append("Configure Distributed Key Management (DKM) for secure encryption key storage")
     
-    # Check role-based access control
-    if "roles" not in config or not config["roles"]:
-        results["recommendations"].append("Configure role-based access control (RBAC) for VMM management")
-    
-    # Check for code integrity policies
-    if "code_integrity" not in config or not config["code_integrity"]:
-        results["recommendations"].append("Enable code integrity policies for enhanced security")
-    
-    # Add recommendations based on best practices
-    if "host_hardening" not in config or not config["host_hardening"]:
-        results["recommendations"].append("Implement host hardening with minimal Windows Server installation")
-    
-    if "update_policy" not in config or not config["update_policy"]:
-        results["recommendations"].append("Establish a security update policy for all cluster components")
-    
-    if "network_isolation" not in config or not config["network_isolation"]:
-        results["recommendations"].append("Implement network isolation for different traffic types")
+    # Check access control, code integrity and other best practices
+    for key, message in _PRACTICE_CHECKS:
+        if not get(key):
+            results["recommendations"].append(message)
     
     return results
 
+def _find_common_pattern(password_lower):
+    """
+    Find the first common pattern, in list order, contained in a lower-cased password.
+    Returns the pattern, or None if the password contains none of them.
+    """
+    if _PASSWORD_AUTOMATON is not None and len(password_lower) >= _AUTOMATON_MIN_LENGTH:
+        ranks = [rank for _, rank in _PASSWORD_AUTOMATON.iter(password_lower)]
+        return _COMMON_PASSWORD_PATTERNS[min(ranks)] if ranks else None
+    
+    for pattern in _COMMON_PASSWORD_PATTERNS:
+        if pattern in password_lower:
+            return pattern
+    return None
+
 def validate_admin_account(username, password):
     """
     Validate administrator account details.
     Returns a dictionary with validation results.
     """
-    results = {
-        "status": True,
-        "errors": [],
-        "warnings": [],
-        "recommendations": []
-    }
+    results = _new_results()
     
     # Validate username
     if not username:
@@ -93,14 +247,22 @@ def validate_admin_account(username, password):
     
     # Validate password strength if provided
     if password:
-        if len(password) < 12:
-            results["warnings"].append("Password should be at least 12 characters long")
+        if len(password) < _PASSWORD_MIN_LENGTH:
+            results["warnings"].append(f"Password should be at least {_PASSWORD_MIN_LENGTH} characters long")
         
-        # Check password complexity
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(not c.isalnum() for c in password)
+        # Check password complexity in a single pass, stopping once every class was seen
+        has_upper = has_lower = has_digit = has_special = False
+        for c in password:
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            elif not c.isalnum():
+                has_special = True
+            if has_upper and has_lower and has_digit and has_special:
+                break
         
         complexity_score = sum([has_upper, has_lower, has_digit, has_special])
         
@@ -108,14 +270,9 @@ def validate_admin_account(username, password):
             results["warnings"].append("Password should contain at least 3 of the following: uppercase letters, lowercase letters, digits, and special characters")
         
         # Check for common patterns
-        common_patterns = [
-            r'123', r'abc', r'qwerty', r'admin', r'password', r'welcome'
-        ]
-        
-        for pattern in common_patterns:
-            if re.search(pattern, password.lower()):
-                results["warnings"].append(f"Password contains common pattern: {pattern}")
-                break
+        pattern = _find_common_pattern(password.lower())
+        if pattern is not None:
+            results["warnings"].append(f"Password contains common pattern: {pattern}")
     else:
         results["errors"].append("Password cannot be empty")
         results["status"] = False
@@ -127,52 +284,23 @@ def create_security_visualization(config):
     Create a visual representation of the security configuration.
     Returns a Plotly figure.
     """
-    # Define security categories and their statuses
-    categories = [
-        "Host OS Hardening",
-        "Network Isolation",
-        "IPsec for Migration",
-        "SMB Encryption",
-        "Distributed Key Management",
-        "Role-Based Access",
-        "Code Integrity",
-        "Update Policy"
-    ]
+    # plotly is only needed here, so keep it out of module import
+    import plotly.graph_objects as go
     
-    # Determine status for each category
-    statuses = []
-    statuses.append(1 if config.get("host_hardening", False) else 0)
-    statuses.append(1 if config.get("network_isolation", False) else 0)
-    statuses.append(1 if config.get("ipsec_migration", False) else 0)
-    statuses.append(1 if config.get("smb_encryption", False) else 0)
-    statuses.append(1 if config.get("dkm", False) else 0)
-    statuses.append(1 if config.get("roles", False) else 0)
-    statuses.append(1 if config.get("code_integrity", False) else 0)
-    statuses.append(1 if config.get("update_policy", False) else 0)
+    # Determine status, bar color and label for each category in one pass
+    get = config.get
+    statuses, colors, labels = zip(*[_STATUS_STYLES[bool(get(key))] for key in _SECURITY_CATEGORY_KEYS])
     
-    # Create figure
-    fig = go.Figure()
-    
-    # Add bars for each category
-    fig.add_trace(go.Bar(
-        x=categories,
-        y=statuses,
-        marker_color=['green' if s else 'red' for s in statuses],
-        text=['Enabled' if s else 'Disabled' for s in statuses],
-        textposition='auto',
-    ))
-    
-    # Update layout
-    fig.update_layout(
-        title="Security Configuration Status",
-        yaxis=dict(
-            title="Status",
-            tickvals=[0, 1],
-            ticktext=["Disabled", "Enabled"],
-            range=[0, 1.2]
-        ),
-        height=500,
-        margin=dict(l=20, r=20, t=60, b=20)
+    # Build the figure in one constructor call so Plotly validates it only once
+    fig = go.Figure(
+        data=[go.Bar(
+            x=_SECURITY_CATEGORY_LABELS,
+            y=list(statuses),
+            marker_color=list(colors),
+            text=list(labels),
+            textposition='auto',
+        )],
+        layout=_SECURITY_LAYOUT
     )
     
     return fig
@@ -182,83 +310,6 @@ def generate_security_recommendations(config):
     Generate security recommendations based on configuration.
     Returns a list of recommendations.
     """
-    recommendations = []
-    
-    # Host hardening recommendations
-    if not config.get("host_hardening", False):
-        recommendations.append({
-            "category": "Host Security",
-            "title": "Implement host hardening",
-            "description": "Use minimal Windows Server installation to reduce attack surface.",
-            "impact": "High",
-            "implementation": "Install only required roles and features. Use security templates."
-        })
-    
-    # Network security recommendations
-    if not config.get("network_isolation", False):
-        recommendations.append({
-            "category": "Network Security",
-            "title": "Implement network isolation",
-            "description": "Separate networks for different traffic types.",
-            "impact": "High",
-            "implementation": "Use VLANs or physical separation for management, VM, and migration traffic."
-        })
-    
-    if not config.get("ipsec_migration", False):
-        recommendations.append({
-            "category": "Network Security",
-            "title": "Enable IPsec for Live Migration",
-            "description": "Encrypt live migration traffic to protect VM data in transit.",
-            "impact": "Medium",
-            "implementation": "Configure IPsec on the live migration network interfaces."
-        })
-    
-    # Data security recommendations
-    if not config.get("smb_encryption", False):
-        recommendations.append({
-            "category": "Data Security",
-            "title": "Enable SMB 3.0 encryption",
-            "description": "Encrypt SMB traffic for end-to-end data protection.",
-            "impact": "Medium",
-            "implementation": "Configure SMB encryption on all file shares used by the cluster."
-        })
-    
-    if not config.get("dkm", False):
-        recommendations.append({
-            "category": "Data Security",
-            "title": "Configure Distributed Key Management",
-            "description": "Securely store encryption keys in Active Directory.",
-            "impact": "High",
-            "implementation": "Set up DKM container in Active Directory and configure VMM to use it."
-        })
-    
-    # Access control recommendations
-    if not config.get("roles", False):
-        recommendations.append({
-            "category": "Access Control",
-            "title": "Implement role-based access control",
-            "description": "Restrict access based on job responsibilities.",
-            "impact": "High",
-            "implementation": "Define and assign appropriate VMM roles for different administrators."
-        })
-    
-    # System integrity recommendations
-    if not config.get("code_integrity", False):
-        recommendations.append({
-            "category": "System Integrity",
-            "title": "Enable code integrity policies",
-            "description": "Prevent unauthorized code execution.",
-            "impact": "Medium",
-            "implementation": "Configure code integrity policies on all hosts."
-        })
-    
-    if not config.get("update_policy", False):
-        recommendations.append({
-            "category": "System Integrity",
-            "title": "Establish update policy",
-            "description": "Keep systems updated with security patches.",
-            "impact": "High",
-            "implementation": "Define and implement a regular patching schedule for all components."
-        })
-    
-    return recommendations
+    get = config.get
+    # Copy the shared table entries so callers can modify their recommendations
+    return [dict(recommendation) for key, recommendation in _SECURITY_RECOMMENDATIONS if not get(key)]
@@ -1,8 +1,28 @@
 import os
-import plotly.graph_objects as go
-import pandas as pd
 import subprocess
 
+# Marker color and size per node group in the storage visualization
+_NODE_STYLES = {
+    "storage": ('#ff7f0e', 35),  # Orange for storage
+    "quorum": ('#d62728', 25),  # Red for quorum
+    "csv": ('#2ca02c', 30),  # Green for CSV
+    "host": ('#1f77b4', 30)  # Blue for hosts
+}
+
+# Static figure layout for the storage visualization
+_STORAGE_LAYOUT = dict(
+    title="Storage Configuration",
+    showlegend=False,
+    hovermode='closest',
+    margin=dict(b=20, l=5, r=5, t=40),
+    xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+    yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+    height=600,
+    width=800,
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)'
+)
+
 def validate_storage_configuration(config):
     """
     Validate a storage configuration dictionary.
@@ -40,16 +60,13 @@ def validate_storage_configuration(config):
         results["errors"].append("At least one CSV volume must be defined")
         results["status"] = False
     
-    for i, volume in enumerate(config["csv_volumes"]):
-        if "size_gb" not in volume:
-            results["warnings"].append(f"CSV volume {i+1} is missing size information")
-        elif volume["size_gb"] < 100:
-            results["warnings"].append(f"CSV volume {i+1} is smaller than recommended (100 GB minimum)")
+    results["warnings"].extend(_check_csv_volume_sizes(config["csv_volumes"]))
     
     # Validate quorum disk
-    if "size_gb" not in config["quorum_disk"]:
+    quorum_size = config["quorum_disk"].get("size_gb")
+    if quorum_size is None:
         results["warnings"].append("Quorum disk is missing size information")
-    elif config["quorum_disk"]["size_gb"] < 1 or config["quorum_disk"]["size_gb"] > 5:
+    elif not 1 <= quorum_size <= 5:
         results["warnings"].append("Quorum disk size should be between 1 GB and 5 GB")
     
     # Add recommendations based on best practices
@@ -62,20 +79,36 @@ def validate_storage_configuration(config):
     if len(config["csv_volumes"]) < 2:
         results["recommendations"].append("Consider using multiple CSV volumes for better performance and management")
     
-    if not config.get("mpio_enabled", False):
+    if not config.get("mpio_enabled"):
         results["recommendations"].append("Enable Multipath I/O (MPIO) for redundant storage connectivity")
     
     # Check if storage is shared between clusters
-    if config.get("shared_between_clusters", False):
+    if config.get("shared_between_clusters"):
         results["warnings"].append("Storage should not be shared between different clusters")
     
     return results
 
+def _check_csv_volume_sizes(volumes):
+    """
+    Check that every CSV volume has a size of at least 100 GB.
+    Returns a list of warnings in volume order.
+    """
+    warnings = []
+    for i, volume in enumerate(volumes):
+        if "size_gb" not in volume:
+            warnings.append(f"CSV volume {i+1} is missing size information")
+        elif volume["size_gb"] < 100:
+            warnings.append(f"CSV volume {i+1} is smaller than recommended (100 GB minimum)")
+    return warnings
+
 def create_storage_visualization(config):
     """
     Create a visual representation of the storage configuration.
     Returns a Plotly figure.
     """
+    # plotly is only needed here, so keep it out of module import
+    import plotly.graph_objects as go
+    
     # Create nodes for the visualization
     nodes = [
         {"id": "Storage", "label": f"{config['storage_type']} Storage", "group": "storage"},
@@ -101,17 +134,13 @@ def create_storage_visualization(config):
             "group": "host"
         })
     
-    # Define edges for connections
-    edges = []
-    
-    # Connect hosts to storage
-    for i in range(host_count):
-        edges.append({"from": f"Host{i+1}", "to": "Storage"})
-    
-    # Connect storage to volumes
-    edges.append({"from": "Storage", "to": "Quorum"})
-    for i in range(len(config["csv_volumes"])):
-        edges.append({"from": "Storage", "to": f"CSV{i+1}"})
+    # Define edges for connections: hosts to storage, then storage to volumes
+    csv_count = len(config["csv_volumes"])
+    edges = [
+        *((f"Host{i+1}", "Storage") for i in range(host_count)),
+        ("Storage", "Quorum"),
+        *(("Storage", f"CSV{i+1}") for i in range(csv_count))
+    ]
     
     # Create node trace
     node_x = []
@@ -127,7 +156,6 @@ def create_storage_visualization(config):
     }
     
     # Position CSV volumes in a horizontal line below storage
-    csv_count = len(config["csv_volumes"])
     for i in range(csv_count):
         offset = (i - (csv_count - 1) / 2) * 1.5
         positions[f"CSV{i+1}"] = [offset, -3]
@@ -144,19 +172,10 @@ def create_storage_visualization(config):
         node_y.append(pos[1])
         node_text.append(node["label"])
         
-        # Set color based on group
-        if node["group"] == "storage":
-            node_colors.append('#ff7f0e')  # Orange for storage
-            node_sizes.append(35)
-        elif node["group"] == "quorum":
-            node_colors.append('#d62728')  # Red for quorum
-            node_sizes.append(25)
-        elif node["group"] == "csv":
-            node_colors.append('#2ca02c')  # Green for CSV
-            node_sizes.append(30)
-        else:  # host
-            node_colors.append('#1f77b4')  # Blue for hosts
-            node_sizes.append(30)
+        # Set color and size based on group
+        color, size = _NODE_STYLES[node["group"]]
+        node_colors.append(color)
+        node_sizes.append(size)
     
     node_trace = go.Scatter(
         x=node_x, y=node_y,
@@ -170,15 +189,13 @@ def create_storage_visualization(config):
             size=node_sizes,
             line_width=2))
     
-    # Create edge trace
-    edge_x = []
-    edge_y = []
-    
-    for edge in edges:
-        from_pos = positions[edge["from"]]
-        to_pos = positions[edge["to"]]
-        edge_x.extend([from_pos[0], to_pos[0], None])
-        edge_y.extend([from_pos[1], to_pos[1], None])
+    # Create edge trace (None separates the line segments)
+    edge_x = [None] * (3 * len(edges))
+    edge_y = [None] * (3 * len(edges))
+    for i, (a, b) in enumerate(edges):
+        j = 3 * i
+        edge_x[j], edge_y[j] = positions[a]
+        edge_x[j + 1], edge_y[j + 1] = positions[b]
     
     edge_trace = go.Scatter(
         x=edge_x, y=edge_y,
@@ -186,90 +203,85 @@ def create_storage_visualization(config):
         hoverinfo='none',
         mode='lines')
     
-    # Create the figure
-    fig = go.Figure(data=[edge_trace, node_trace],
-                   layout=go.Layout(
-                       title="Storage Configuration",
-                       showlegend=False,
-                       hovermode='closest',
-                       margin=dict(b=20,l=5,r=5,t=40),
-                       xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                       yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                       height=600,
-                       width=800,
-                       plot_bgcolor='rgba(0,0,0,0)',
-                       paper_bgcolor='rgba(0,0,0,0)',
-                   ))
-    
-    # Add annotations for storage details
-    fig.add_annotation(
-        x=positions["Storage"][0],
-        y=positions["Storage"][1] + 0.5,
+    # Annotations for storage details
+    storage_x, storage_y = positions["Storage"]
+    annotations = [dict(
+        x=storage_x,
+        y=storage_y + 0.5,
         text=f"Type: {config['storage_type']}",
         showarrow=False,
         font=dict(size=12)
-    )
+    )]
     
-    if config.get("mpio_enabled", False):
-        fig.add_annotation(
-            x=positions["Storage"][0],
-            y=positions["Storage"][1] - 0.5,
+    if config.get("mpio_enabled"):
+        annotations.append(dict(
+            x=storage_x,
+            y=storage_y - 0.5,
             text="MPIO Enabled",
             showarrow=False,
             font=dict(size=10, color="green")
-        )
+        ))
     
-    return fig
+    # Create the figure
+    return go.Figure(data=[edge_trace, node_trace], layout=dict(_STORAGE_LAYOUT, annotations=annotations))
 
 def estimate_storage_needs(vm_count, avg_vm_size_gb):
     """
     Estimate storage needs based on number of VMs and average VM size.
     Returns a dictionary with recommendations.
     """
-    # Basic calculations
     total_vm_storage = vm_count * avg_vm_size_gb
     
-    # Add overhead for VM configuration, checkpoints, etc. (20%)
-    total_storage_with_overhead = total_vm_storage * 1.2
+    # Storage with 20% overhead for VM configuration, checkpoints, etc. is
+    # overhead_units / 5; keeping the factor of five avoids float rounding
+    overhead_units = total_vm_storage * 6
     
-    # Quorum disk size
-    quorum_size = 1  # GB, standard size
+    # 2TB per CSV recommended max, distributed evenly over at least two CSVs
+    csv_count = max(2, int(overhead_units // 10000) + 1)
+    csv_units = 5 * csv_count
     
-    # Determine number of CSV volumes based on size
-    csv_count = max(2, int(total_storage_with_overhead / 2000) + 1)  # 2TB per CSV recommended max
-    
-    # Calculate CSV sizes (distribute evenly)
-    csv_size = total_storage_with_overhead / csv_count
-    
-    recommendations = {
+    return {
         "quorum_disk": {
-            "size_gb": quorum_size,
+            "size_gb": 1,  # GB, standard size
             "purpose": "Cluster quorum"
         },
-        "csv_volumes": []
+        "csv_volumes": [
+            {"size_gb": int(overhead_units // csv_units), "purpose": f"VM Storage {i+1}"}
+            for i in range(csv_count)
+        ] + [
+            # Buffer volume for future growth
+            {"size_gb": int(overhead_units // 25), "purpose": "Growth buffer"}
+        ],
+        "text": [
+            f"Total VM storage required: {total_vm_storage} GB",
+            f"With 20% overhead: {overhead_units / 5:.0f} GB",
+            f"Recommended CSV count: {csv_count}",
+            f"Recommended CSV size: {overhead_units / csv_units:.0f} GB each",
+            "Consider implementing storage redundancy (RAID, mirroring)",
+            "Enable MPIO for redundant storage connectivity"
+        ]
     }
+
+def estimate_storage_needs_batch(vm_counts, avg_vm_sizes_gb):
+    """
+    Estimate storage needs for many (VM count, average VM size) pairs at once,
+    using the same rules as estimate_storage_needs.
+    Returns a dictionary of NumPy arrays with the total storage including
+    overhead, the recommended CSV count and the size of each CSV.
+    """
+    # numpy is only needed here, so keep it out of module import
+    import numpy as np
     
-    # Create CSV volume recommendations
-    for i in range(csv_count):
-        recommendations["csv_volumes"].append({
-            "size_gb": int(csv_size),
-            "purpose": f"VM Storage {i+1}"
-        })
+    vm_counts = np.asarray(vm_counts, dtype=np.float64)
+    avg_vm_sizes_gb = np.asarray(avg_vm_sizes_gb, dtype=np.float64)
     
-    # Add buffer volume for future growth
-    recommendations["csv_volumes"].append({
-        "size_gb": int(total_storage_with_overhead * 0.2),
-        "purpose": "Growth buffer"
-    })
-    
-    # Add recommendations text
-    recommendations["text"] = [
-        f"Total VM storage required: {total_vm_storage} GB",
-        f"With 20% overhead: {total_storage_with_overhead:.0f} GB",
-        f"Recommended CSV count: {csv_count}",
-        f"Recommended CSV size: {csv_size:.0f} GB each",
-        "Consider implementing storage redundancy (RAID, mirroring)",
-        "Enable MPIO for redundant storage connectivity"
-    ]
+    # 20% overhead, 2 TB per CSV and at least two CSVs
+    total_storage_with_overhead = vm_counts * avg_vm_sizes_gb * 1.2
+    csv_count = np.maximum(2, (total_storage_with_overhead // 2000).astype(np.int64) + 1)
+    csv_size = total_storage_with_overhead / csv_count
     
-    return recommendations
+    return {
+        "total_storage_gb": total_storage_with_overhead,
+        "csv_count": csv_count,
+        "csv_size_gb": csv_size
+    }
@@ -1,17 +1,95 @@
 import os
+import copy
+import functools
+import time
 import platform
+import sys
 import psutil
 import socket
 import subprocess
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
+from concurrent.futures import ThreadPoolExecutor
+
+# Threads for the system probes run alongside the interface lookup
+_PROBE_WORKERS = 2
+
+# Bytes per GB for the sizes reported by the checks
+_BYTES_PER_GB = 1 << 30
+
+# Seconds for which system information is reused between page renders
+_SYSTEM_TTL = 30
+
+# Static gauge styling and layout shared by the CPU and memory usage gauges
+_GAUGE_STYLE = {
+    "axis": {"range": [0, 100]},
+    "bar": {"color": "blue"},
+    "steps": [
+        {"range": [0, 50], "color": "lightgray"},
+        {"range": [50, 80], "color": "gray"},
+        {"range": [80, 100], "color": "red"}
+    ],
+    "threshold": {
+        "line": {"color": "red", "width": 4},
+        "thickness": 0.75,
+        "value": 90
+    }
+}
+_GAUGE_LAYOUT = dict(
+    height=300,
+    margin=dict(l=10, r=10, t=30, b=10)
+)
+
+# Static layout of the stacked disk usage chart
+_DISK_LAYOUT = dict(
+    title="Disk Usage",
+    barmode="stack",
+    xaxis_title="Disk",
+    yaxis_title="GB",
+    height=300,
+    margin=dict(l=10, r=10, t=30, b=10)
+)
+
+# Interface entry field filled from each address family
+_ADDRESS_FIELDS = {
+    socket.AF_INET: "ip_address",
+    socket.AF_INET6: "ipv6_address",
+    psutil.AF_LINK: "mac_address"
+}
+
+# cpu_percent(interval=None) reports usage since the previous call, so take the
+# first sample at import; readings taken less than a second apart are unreliable
+psutil.cpu_percent(interval=None)
 
 def check_system_requirements():
     """
     Check if the current system meets the requirements for running the VMM Cluster Implementation Tool.
     Returns a dictionary with the status and information about the system.
     """
+    return copy.deepcopy(_check_system_requirements(int(time.time()) // _SYSTEM_TTL))
+
+@functools.lru_cache(maxsize=1)
+def _check_system_requirements(bucket):
+    """
+    Collect system information and requirement checks once per TTL bucket.
+    Shares the bucket's cached hardware, network and disk snapshots with the other checks.
+    """
+    # The disk and memory queries are independent system calls that release the GIL,
+    # so run them alongside the interface lookup
+    with ThreadPoolExecutor(max_workers=_PROBE_WORKERS) as executor:
+        disks_future = executor.submit(_get_disk_info, bucket)
+        hardware_future = executor.submit(_hardware_info, bucket)
+        
+        # Take the IP address from the first active non-loopback interface and only
+        # open a probe socket when there is none
+        interfaces = _get_network_interfaces(bucket)
+        ip_address = next(
+            (interface["ip_address"] for interface in interfaces
+             if interface["is_up"] and interface["ip_address"] and not interface["ip_address"].startswith("127.")),
+            None
+        ) or _get_ip_address(bucket)
+        
+        disks = disks_future.result()
+        hardware = hardware_future.result()
+    
     system_info = {
         "status": True,
         "message": "System meets requirements",
@@ -22,135 +100,147 @@ def check_system_requirements():
         },
         "hardware": {
             "processor": platform.processor(),
-            "cpu_count": psutil.cpu_count(logical=False),
-            "cpu_logical_count": psutil.cpu_count(logical=True),
-            "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
-            "memory_available_gb": round(psutil.virtual_memory().available / (1024**3), 2)
+            **hardware
         },
         "network": {
             "hostname": socket.gethostname(),
-            "ip_address": get_ip_address(),
-            "interfaces": get_network_interfaces()
+            "ip_address": ip_address,
+            "interfaces": interfaces
         },
         "storage": {
-            "disks": get_disk_info()
+            "disks": disks
         }
     }
     
-    # Check requirements
+    # Check requirements, keeping the message of the last one that fails
     requirements = []
-    
-    # Check Python version
-    python_version = platform.python_version()
-    python_req = {"name": "Python version", "value": python_version, "required": "3.6+", "status": True}
-    if int(python_version.split('.')[0]) < 3 or (int(python_version.split('.')[0]) == 3 and int(python_version.split('.')[1]) < 6):
-        python_req["status"] = False
-        system_info["status"] = False
-        system_info["message"] = "Python version does not meet requirements"
-    requirements.append(python_req)
-    
-    # Check CPU
-    cpu_req = {
-        "name": "CPU cores", 
-        "value": system_info["hardware"]["cpu_count"], 
-        "required": "2+", 
-        "status": system_info["hardware"]["cpu_count"] >= 2
-    }
-    if not cpu_req["status"]:
-        system_info["status"] = False
-        system_info["message"] = "CPU does not meet requirements"
-    requirements.append(cpu_req)
-    
-    # Check memory
-    memory_req = {
-        "name": "Memory (RAM)", 
-        "value": f"{system_info['hardware']['memory_total_gb']} GB", 
-        "required": "4+ GB", 
-        "status": system_info["hardware"]["memory_total_gb"] >= 4
-    }
-    if not memory_req["status"]:
-        system_info["status"] = False
-        system_info["message"] = "Memory does not meet requirements"
-    requirements.append(memory_req)
-    
-    # Check disk space
-    disk_space_req = {
-        "name": "Disk space", 
-        "value": f"{system_info['storage']['disks'][0]['free_gb']} GB free", 
-        "required": "10+ GB free", 
-        "status": system_info["storage"]["disks"][0]["free_gb"] >= 10
-    }
-    if not disk_space_req["status"]:
-        system_info["status"] = False
-        system_info["message"] = "Disk space does not meet requirements"
-    requirements.append(disk_space_req)
+    for name, required, failure_message, check in _SYSTEM_REQUIREMENTS:
+        value, status = check(system_info)
+        requirements.append({"name": name, "value": value, "required": required, "status": status})
+        if not status:
+            system_info["status"] = False
+            system_info["message"] = failure_message
     
     system_info["requirements"] = requirements
     
     return system_info
 
+def _to_gb(byte_count):
+    """
+    Convert a size in bytes to GB, rounded to two decimals as shown in the reports.
+    """
+    return round(byte_count / _BYTES_PER_GB, 2)
+
+def _disk_space_requirement(system_info):
+    """
+    Check the free space on the first readable disk.
+    Returns a tuple of (displayed value, status).
+    """
+    disks = system_info["storage"]["disks"]
+    if not disks:
+        return "No readable disk", False
+    free_gb = disks[0]["free_gb"]
+    return f"{free_gb} GB free", free_gb >= 10
+
+# Tool requirements: (name, required value, failure message, check returning (value, status))
+_SYSTEM_REQUIREMENTS = (
+    ("Python version", "3.6+", "Python version does not meet requirements",
+     lambda system_info: (platform.python_version(), sys.version_info >= (3, 6))),
+    ("CPU cores", "2+", "CPU does not meet requirements",
+     lambda system_info: (system_info["hardware"]["cpu_count"], system_info["hardware"]["cpu_count"] >= 2)),
+    ("Memory (RAM)", "4+ GB", "Memory does not meet requirements",
+     lambda system_info: (f"{system_info['hardware']['memory_total_gb']} GB", system_info["hardware"]["memory_total_gb"] >= 4)),
+    ("Disk space", "10+ GB free", "Disk space does not meet requirements", _disk_space_requirement)
+)
+
+@functools.lru_cache(maxsize=1)
+def _hardware_info(bucket):
+    """
+    Query CPU counts and memory once per TTL bucket, shared by the system and VMM checks.
+    Returns a dictionary with the core counts and memory sizes in GB.
+    """
+    memory = psutil.virtual_memory()
+    return {
+        "cpu_count": psutil.cpu_count(logical=False),
+        "cpu_logical_count": psutil.cpu_count(logical=True),
+        "memory_total_gb": _to_gb(memory.total),
+        "memory_available_gb": _to_gb(memory.available)
+    }
+
 def get_ip_address():
     """Get the IP address of the current machine"""
+    return _get_ip_address(int(time.time()) // _SYSTEM_TTL)
+
+@functools.lru_cache(maxsize=1)
+def _get_ip_address(bucket):
+    """Look up the outbound IP address once per TTL bucket"""
     try:
         # This creates a socket to a public server but doesn't send any data
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
-    except:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except OSError:
         return "Unable to determine IP address"
 
 def get_network_interfaces():
     """Get information about network interfaces"""
+    return copy.deepcopy(_get_network_interfaces(int(time.time()) // _SYSTEM_TTL))
+
+@functools.lru_cache(maxsize=1)
+def _get_network_interfaces(bucket):
+    """Query network interfaces once per TTL bucket"""
     interfaces = []
     
     if_addrs = psutil.net_if_addrs()
     if_stats = psutil.net_if_stats()
     
     for interface_name, addr_list in if_addrs.items():
-        if interface_name in if_stats:
-            # Check if interface is up and running
-            is_up = if_stats[interface_name].isup
-            
-            # Get IP addresses
-            ipv4_addr = None
-            ipv6_addr = None
-            mac_addr = None
-            
-            for addr in addr_list:
-                if addr.family == socket.AF_INET:
-                    ipv4_addr = addr.address
-                elif addr.family == socket.AF_INET6:
-                    ipv6_addr = addr.address
-                elif addr.family == psutil.AF_LINK:
-                    mac_addr = addr.address
-            
-            interfaces.append({
-                "name": interface_name,
-                "ip_address": ipv4_addr,
-                "ipv6_address": ipv6_addr,
-                "mac_address": mac_addr,
-                "is_up": is_up
-            })
+        stats = if_stats.get(interface_name)
+        if stats is None:
+            continue
+        
+        interface = {
+            "name": interface_name,
+            "ip_address": None,
+            "ipv6_address": None,
+            "mac_address": None,
+            "is_up": stats.isup
+        }
+        
+        # Keep the last address of each family
+        for addr in addr_list:
+            field = _ADDRESS_FIELDS.get(addr.family)
+            if field is not None:
+                interface[field] = addr.address
+        
+        interfaces.append(interface)
     
     return interfaces
 
 def get_disk_info():
     """Get information about disk drives"""
+    return copy.deepcopy(_get_disk_info(int(time.time()) // _SYSTEM_TTL))
+
+@functools.lru_cache(maxsize=1)
+def _get_disk_info(bucket):
+    """Query disk drives once per TTL bucket"""
     disks = []
     
     partitions = psutil.disk_partitions()
     for partition in partitions:
+        # Skip drives without a mounted filesystem, such as empty CD or removable drives,
+        # before disk_usage waits on them
+        if not partition.fstype or "cdrom" in partition.opts:
+            continue
         try:
             usage = psutil.disk_usage(partition.mountpoint)
             disks.append({
                 "device": partition.device,
                 "mountpoint": partition.mountpoint,
                 "fstype": partition.fstype,
-                "total_gb": round(usage.total / (1024**3), 2),
-                "used_gb": round(usage.used / (1024**3), 2),
-                "free_gb": round(usage.free / (1024**3), 2),
+                "total_gb": _to_gb(usage.total),
+                "used_gb": _to_gb(usage.used),
+                "free_gb": _to_gb(usage.free),
                 "percent_used": usage.percent
             })
         except (PermissionError, FileNotFoundError):
@@ -159,11 +249,43 @@ def get_disk_info():
     
     return disks
 
+@functools.lru_cache(maxsize=1)
+def _is_windows_admin():
+    """
+    Check whether the tool runs with administrative privileges on Windows.
+    The process token does not change, so the answer is cached for the process lifetime.
+    Returns True for an administrator and False for a standard user.
+    """
+    try:
+        import ctypes
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except (ImportError, AttributeError, OSError):
+        # Fall back to probing an admin-only directory
+        return os.access("C:\\Windows\\System32\\config", os.R_OK)
+
+def clear_system_cache():
+    """
+    Discard cached system information so the next check queries the system again.
+    """
+    _check_system_requirements.cache_clear()
+    _check_vmm_prerequisites.cache_clear()
+    _get_network_interfaces.cache_clear()
+    _get_disk_info.cache_clear()
+    _hardware_info.cache_clear()
+    _get_ip_address.cache_clear()
+
 def check_vmm_prerequisites(check_windows=True):
     """
     Check if the system has the prerequisites for VMM implementation.
     Returns a dictionary with check results.
     """
+    return copy.deepcopy(_check_vmm_prerequisites(check_windows, int(time.time()) // _SYSTEM_TTL))
+
+@functools.lru_cache(maxsize=2)
+def _check_vmm_prerequisites(check_windows, bucket):
+    """
+    Run the VMM prerequisite checks once per TTL bucket.
+    """
     results = {
         "status": True,
         "checks": [],
@@ -198,14 +320,13 @@ def check_vmm_prerequisites(check_windows=True):
     
     try:
         if platform.system() == "Windows":
-            # On Windows, attempt to access admin-only directory
-            admin_status = os.access("C:\\Windows\\System32\\config", os.R_OK)
+            admin_status = _is_windows_admin()
             admin_check["details"] = "Administrative" if admin_status else "Standard user"
             if not admin_status:
                 admin_check["status"] = False
                 admin_check["message"] = "Administrative privileges required"
                 results["warnings"].append("Tool is not running with administrative privileges")
-    except:
+    except (OSError, AttributeError):
         admin_check["status"] = False
         admin_check["message"] = "Unable to determine privilege level"
         results["warnings"].append("Could not verify administrative privileges")
@@ -213,7 +334,8 @@ def check_vmm_prerequisites(check_windows=True):
     results["checks"].append(admin_check)
     
     # Check memory
-    memory_gb = round(psutil.virtual_memory().total / (1024**3), 2)
+    hardware = _hardware_info(bucket)
+    memory_gb = hardware["memory_total_gb"]
     memory_check = {
         "name": "Memory",
         "status": memory_gb >= 4,
@@ -228,7 +350,7 @@ def check_vmm_prerequisites(check_windows=True):
     results["checks"].append(memory_check)
     
     # Check CPU
-    cpu_cores = psutil.cpu_count(logical=False)
+    cpu_cores = hardware["cpu_count"]
     cpu_check = {
         "name": "CPU",
         "status": cpu_cores >= 2,
@@ -245,8 +367,8 @@ def check_vmm_prerequisites(check_windows=True):
     # Check disk space
     disk_space_gb = 0
     try:
-        disk_space_gb = round(psutil.disk_usage(os.getcwd()).free / (1024**3), 2)
-    except:
+        disk_space_gb = _to_gb(psutil.disk_usage(os.getcwd()).free)
+    except OSError:
         pass
     
     disk_check = {
@@ -271,10 +393,7 @@ def check_vmm_prerequisites(check_windows=True):
     }
     
     # Check if any network interface is up
-    if_stats = psutil.net_if_stats()
-    active_interfaces = [iface for iface, stats in if_stats.items() if stats.isup]
-    
-    if not active_interfaces:
+    if not any(stats.isup for stats in psutil.net_if_stats().values()):
         network_check["status"] = False
         network_check["message"] = "No active network interfaces detected"
         results["errors"].append("No active network connection found")
@@ -284,90 +403,49 @@ def check_vmm_prerequisites(check_windows=True):
     
     return results
 
+def _usage_gauge(title, value):
+    """
+    Create a percentage usage gauge.
+    Returns a Plotly figure.
+    """
+    import plotly.graph_objects as go
+    
+    # Build the figure in one constructor call so Plotly validates it only once
+    return go.Figure(
+        data=[go.Indicator(
+            mode="gauge+number",
+            value=value,
+            title={"text": title},
+            gauge=_GAUGE_STYLE
+        )],
+        layout=_GAUGE_LAYOUT
+    )
+
 def create_system_visualization(system_info):
     """
     Create a visual representation of the system information.
     Returns a dictionary with Plotly figures.
     """
-    figures = {}
+    # plotly is only needed for the figures, so keep it out of module import
+    import plotly.graph_objects as go
     
-    # Create CPU usage gauge
-    cpu_usage = psutil.cpu_percent()
-    fig_cpu = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=cpu_usage,
-        title={"text": "CPU Usage"},
-        gauge={
-            "axis": {"range": [0, 100]},
-            "bar": {"color": "blue"},
-            "steps": [
-                {"range": [0, 50], "color": "lightgray"},
-                {"range": [50, 80], "color": "gray"},
-                {"range": [80, 100], "color": "red"}
-            ],
-            "threshold": {
-                "line": {"color": "red", "width": 4},
-                "thickness": 0.75,
-                "value": 90
-            }
-        }
-    ))
-    
-    fig_cpu.update_layout(
-        height=300,
-        margin=dict(l=10, r=10, t=30, b=10)
-    )
-    
-    figures["cpu"] = fig_cpu
-    
-    # Create memory usage gauge
-    memory_percent = psutil.virtual_memory().percent
-    fig_memory = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=memory_percent,
-        title={"text": "Memory Usage"},
-        gauge={
-            "axis": {"range": [0, 100]},
-            "bar": {"color": "blue"},
-            "steps": [
-                {"range": [0, 50], "color": "lightgray"},
-                {"range": [50, 80], "color": "gray"},
-                {"range": [80, 100], "color": "red"}
-            ],
-            "threshold": {
-                "line": {"color": "red", "width": 4},
-                "thickness": 0.75,
-                "value": 90
-            }
-        }
-    ))
-    
-    fig_memory.update_layout(
-        height=300,
-        margin=dict(l=10, r=10, t=30, b=10)
-    )
-    
-    figures["memory"] = fig_memory
-    
-    # Create disk usage chart
-    disk_data = []
-    for disk in system_info["storage"]["disks"]:
-        disk_data.append({
-            "Disk": disk["mountpoint"],
-            "Used (GB)": disk["used_gb"],
-            "Free (GB)": disk["free_gb"]
-        })
-    
-    df_disk = pd.DataFrame(disk_data)
-    fig_disk = px.bar(df_disk, x="Disk", y=["Used (GB)", "Free (GB)"], title="Disk Usage",
-                     barmode="stack", height=300)
+    figures = {}
     
-    fig_disk.update_layout(
-        margin=dict(l=10, r=10, t=30, b=10)
+    # Create CPU and memory usage gauges
+    figures["cpu"] = _usage_gauge("CPU Usage", psutil.cpu_percent(interval=None))
+    figures["memory"] = _usage_gauge("Memory Usage", psutil.virtual_memory().percent)
+    
+    # Create disk usage chart with used and free space stacked per mountpoint
+    disks = system_info["storage"]["disks"]
+    mountpoints = [disk["mountpoint"] for disk in disks]
+    figures["disk"] = go.Figure(
+        data=[
+            go.Bar(name="Used (GB)", x=mountpoints, y=[disk["used_gb"] for disk in disks], marker_color="#636efa"),
+            go.Bar(name="Free (GB)", x=mountpoints, y=[disk["free_gb"] for disk in disks], marker_color="#EF553B")
+        ],
+        layout=_DISK_LAYOUT
     )
     
-    figures["disk"] = fig_disk
-    
     # Create system requirements check
     req_status = [req["status"] for req in system_info["requirements"]]
     req_names = [req["name"] for req in system_info["requirements"]]